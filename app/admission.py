@@ -0,0 +1,132 @@
+import asyncio
+import os
+import re
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+class Shed(Exception):
+    """Raised when a request cannot be admitted (queue full or wait timed out)."""
+
+
+class Budget:
+    """
+    Concurrency budget for a group of routes: at most `max_concurrent` requests
+    run at once, at most `max_queue` wait for a slot, the rest are shed.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.waiting = 0
+        self.admitted_total = 0
+        self.shed_total = 0
+
+    async def acquire(self) -> None:
+        if self._sem.locked() and self.waiting >= self.max_queue:
+            self.shed_total += 1
+            raise Shed()
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.shed_total += 1
+            raise Shed()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        self.admitted_total += 1
+
+    def release(self) -> None:
+        self.active -= 1
+        self._sem.release()
+
+
+# Routes that never go through admission control (liveness, ops)
+BYPASS_PREFIXES = ("/health", "/version", "/metrics")
+
+QUEUE_TIMEOUT_S = _env_float("ADMISSION_QUEUE_TIMEOUT_S", 5.0)
+RETRY_AFTER_S = _env_int("ADMISSION_RETRY_AFTER_S", 2)
+
+# Per-route limits: (budget name, path pattern, max_concurrent, max_queue).
+# Each can be overridden with ADMISSION_<NAME>_MAX_CONCURRENT / _MAX_QUEUE.
+# Defaults add up to about the size of the default threadpool (40).
+ROUTE_LIMITS = [
+    ("summary", r"^/v1/country/[^/]+/(summary|bundle)$", 4, 8),  # multi-query country pages
+    ("country", r"^/v1/country/[^/]+$", 6, 12),
+    ("timeline", r"^/v1/timeline/[^/]+$", 6, 12),
+    ("map", r"^/v1/map$", 8, 16),
+    ("search", r"^/v1/search$", 4, 8),  # full-text, unbounded match sets
+    ("events", r"^/v1/events$", 4, 8),
+    ("articles", r"^/v1/articles$", 4, 8),
+    ("metadata", r"^/v1/metadata$", 4, 8),
+]
+
+
+def _budget(name: str, max_concurrent: int, max_queue: int) -> Budget:
+    key = name.upper()
+    return Budget(
+        name,
+        max_concurrent=_env_int(f"ADMISSION_{key}_MAX_CONCURRENT", max_concurrent),
+        max_queue=_env_int(f"ADMISSION_{key}_MAX_QUEUE", max_queue),
+        queue_timeout=QUEUE_TIMEOUT_S,
+    )
+
+
+# First match wins; the last entry is the default budget for everything else
+BUDGETS = [
+    (re.compile(pattern), _budget(name, max_concurrent, max_queue))
+    for name, pattern, max_concurrent, max_queue in ROUTE_LIMITS
+] + [
+    (
+        re.compile(r"^/"),
+        Budget(
+            "default",
+            max_concurrent=_env_int("ADMISSION_MAX_CONCURRENT", 4),
+            max_queue=_env_int("ADMISSION_MAX_QUEUE", 8),
+            queue_timeout=QUEUE_TIMEOUT_S,
+        ),
+    ),
+]
+
+
+def budget_for(path: str) -> Budget | None:
+    if path.startswith(BYPASS_PREFIXES):
+        return None
+    for pattern, budget in BUDGETS:
+        if pattern.match(path):
+            return budget
+    return None
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition of queue depth and shed counts per budget."""
+    lines = []
+    metrics = [
+        ("whogoverns_admission_active", "gauge", "Requests currently running", "active"),
+        ("whogoverns_admission_queue_depth", "gauge", "Requests waiting for a slot", "waiting"),
+        ("whogoverns_admission_admitted_total", "counter", "Requests admitted", "admitted_total"),
+        ("whogoverns_admission_shed_total", "counter", "Requests shed with 503", "shed_total"),
+        ("whogoverns_admission_limit", "gauge", "Configured concurrency limit", "max_concurrent"),
+        ("whogoverns_admission_queue_limit", "gauge", "Configured wait queue size", "max_queue"),
+    ]
+    for name, kind, help_text, attr in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for _, budget in BUDGETS:
+            lines.append(f'{name}{{budget="{budget.name}"}} {getattr(budget, attr)}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,40 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+
+def ttl_cache(ttl_seconds: int, maxsize: int = 1024):
+    """
+    In-process LRU cache with expiry for endpoint functions.
+    Keyed on call arguments; exceptions (e.g. 404s) are not cached.
+    TTLs mirror the Cache-Control max-age set in app/main.py.
+    """
+    def decorator(func):
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and hit[0] > now:
+                    entries.move_to_end(key)
+                    return hit[1]
+
+            value = func(*args, **kwargs)
+
+            with lock:
+                entries[key] = (now + ttl_seconds, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
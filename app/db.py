@@ -1,12 +1,50 @@
 import os
-from psycopg import Connection
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from psycopg import Connection, Cursor
 from psycopg.rows import dict_row
 
+# Set per request by observers (profiling, query budgets) to collect issued statements
+_query_logs: ContextVar[tuple[list, ...]] = ContextVar("whogoverns_query_logs", default=())
+
 def get_db_url() -> str:
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         raise RuntimeError("DATABASE_URL is not set")
     return db_url
 
+class TrackedCursor(Cursor):
+    """Cursor that records statements when a query log is active."""
+
+    def execute(self, query, params=None, **kwargs):
+        logs = _query_logs.get()
+        if not logs:
+            return super().execute(query, params, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super().execute(query, params, **kwargs)
+        finally:
+            entry = {
+                "sql": " ".join(str(query).split()),
+                "params": params,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "rows": self.rowcount,
+            }
+            for log in logs:
+                log.append(entry)
+
+@contextmanager
+def record_queries():
+    """Collect every statement issued through get_conn() in this context (nestable)."""
+    log = []
+    token = _query_logs.set(_query_logs.get() + (log,))
+    try:
+        yield log
+    finally:
+        _query_logs.reset(token)
+
 def get_conn() -> Connection:
-    return Connection.connect(get_db_url(), row_factory=dict_row)
\ No newline at end of file
+    return Connection.connect(get_db_url(), row_factory=dict_row, cursor_factory=TrackedCursor)
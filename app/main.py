@@ -4,12 +4,18 @@ load_dotenv()
 import os
 import time
 import uuid
+import json
+import asyncio
 import logging
+import threading
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from app.db import get_conn
+from app import admission, profiling, query_budget, warmup
+from app.db import get_conn, record_queries
 from app.routers import (
     metadata,
     map as map_router,
@@ -17,10 +23,34 @@ from app.routers import (
     events,
     articles,
     country_summary,
+    country_bundle,
     country,
+    search,
 )
 
-app = FastAPI(title="WhoGoverns API", version="1.0.0")
+
+def _log_warmup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logging.getLogger("whogoverns.warmup").error("warmup task failed", exc_info=task.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm caches in the background; /health/ready flips once done
+    task = None
+    stop = threading.Event()
+    if os.getenv("WARMUP_ENABLED", "1") != "0":
+        task = asyncio.create_task(asyncio.to_thread(warmup.run, stop))
+        task.add_done_callback(_log_warmup_failure)
+    else:
+        warmup.state["ready"] = True
+    yield
+    stop.set()
+    if task and not task.done():
+        task.cancel()
+
+
+app = FastAPI(title="WhoGoverns API", version="1.0.0", lifespan=lifespan)
 
 # -----------------------------
 # Logging (observability)
@@ -29,6 +59,118 @@ logger = logging.getLogger("whogoverns")
 logging.basicConfig(level=logging.INFO)
 
 
+# -----------------------------
+# Query budgets (N+1 / duplicate-query detection)
+# -----------------------------
+# Enforced when ENV is explicitly dev/test or QUERY_BUDGET_MODE is set; off otherwise.
+@app.middleware("http")
+async def query_budgets(request: Request, call_next):
+    if query_budget.MODE == "off":
+        return await call_next(request)
+
+    with record_queries() as queries:
+        response = await call_next(request)
+
+    report = query_budget.analyze(queries)
+    budget = query_budget.budget_of(request.scope.get("endpoint"))
+    path = request.url.path
+
+    for kind in ("duplicates", "repeated"):
+        for item in report[kind]:
+            logger.warning("query_budget %s path=%s count=%s sql=%s", kind, path, item["count"], item["sql"][:200])
+
+    response.headers["x-query-count"] = str(report["count"])
+
+    if budget is not None and report["count"] > budget:
+        logger.warning("query_budget exceeded path=%s count=%s budget=%s", path, report["count"], budget)
+        if query_budget.MODE == "enforce":
+            content = {"detail": "Query budget exceeded", "count": report["count"], "budget": budget}
+            if query_budget.SHOW_STATEMENTS:
+                content["statements"] = [q["sql"] for q in queries]
+            return JSONResponse(status_code=500, content=content)
+
+    return response
+
+
+# -----------------------------
+# Request profiling (opt-in, for production diagnosis)
+# -----------------------------
+# Needs PROFILING_ENABLED=1 and a matching "x-profile: <PROFILE_SECRET>" header.
+profile_logger = logging.getLogger("whogoverns.profile")
+
+
+@app.middleware("http")
+async def request_profiling(request: Request, call_next):
+    if not profiling.is_enabled() or not profiling.is_authorized(request.headers.get(profiling.PROFILE_HEADER)):
+        return await call_next(request)
+
+    start = time.perf_counter()
+    report, token = profiling.start()
+    try:
+        with record_queries() as queries:
+            response = await call_next(request)
+    finally:
+        profiling.stop(token)
+    total_ms = round((time.perf_counter() - start) * 1000, 3)
+
+    db_ms = round(sum(q["duration_ms"] for q in queries), 3)
+    # Route time minus endpoint time: parameter validation, threadpool
+    # dispatch and response serialization together
+    validate_serialize_ms = None
+    if report["route_ms"] is not None and report["endpoint_ms"] is not None:
+        validate_serialize_ms = round(report["route_ms"] - report["endpoint_ms"], 3)
+
+    profile_logger.info(
+        "profile %s",
+        json.dumps({
+            "method": request.method,
+            "path": request.url.path,
+            "query": request.url.query,
+            "status": response.status_code,
+            "total_ms": total_ms,
+            "endpoint_ms": report["endpoint_ms"],
+            "validate_serialize_ms": validate_serialize_ms,
+            "db_ms": db_ms,
+            "queries": queries,
+            "call_graph": report["call_graph"],
+        }, default=str),
+    )
+
+    timings = [f"total;dur={total_ms}", f"db;dur={db_ms}"]
+    if report["endpoint_ms"] is not None:
+        timings.append(f"handler;dur={report['endpoint_ms']}")
+    if validate_serialize_ms is not None:
+        timings.append(f"validate_serialize;dur={validate_serialize_ms}")
+    response.headers["Server-Timing"] = ", ".join(timings)
+    response.headers["x-profile-queries"] = str(len(queries))
+    return response
+
+
+# -----------------------------
+# Admission control (load shedding)
+# -----------------------------
+# Registered before the logging middleware so shed requests are still logged.
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    budget = admission.budget_for(request.url.path)
+    if budget is None:
+        return await call_next(request)
+
+    try:
+        await budget.acquire()
+    except admission.Shed:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Server overloaded, retry later"},
+            headers={"Retry-After": str(admission.RETRY_AFTER_S)},
+        )
+
+    try:
+        return await call_next(request)
+    finally:
+        budget.release()
+
+
 @app.middleware("http")
 async def request_logging(request: Request, call_next):
     request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
@@ -60,11 +202,13 @@ async def cache_headers(request: Request, call_next):
     path = request.url.path
     cache = "no-store"
 
-    if path.startswith("/v1/metadata"):
+    if response.status_code >= 500:
+        pass  # never cache errors or shed responses
+    elif path.startswith("/v1/metadata"):
         cache = "public, max-age=86400"  # 24h
     elif path.startswith("/v1/map") or path.startswith("/v1/timeline"):
         cache = "public, max-age=3600"   # 1h
-    elif path.startswith("/v1/events") or path.startswith("/v1/articles"):
+    elif path.startswith("/v1/events") or path.startswith("/v1/articles") or path.startswith("/v1/search"):
         cache = "public, max-age=600"    # 10 min
 
     response.headers["Cache-Control"] = cache
@@ -106,6 +250,22 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/health/ready")
+def health_ready():
+    state = warmup.state
+    if not state["ready"]:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "warming_up", "attempts": state["attempts"], "failed": state["failed"]},
+        )
+    return {
+        "status": "ready",
+        "warmed": state["warmed"],
+        "failed": state["failed"],
+        "timeline_failed": state["timeline_failed"],
+    }
+
+
 @app.get("/health/db")
 def health_db():
     try:
@@ -116,6 +276,11 @@ def health_db():
         return {"status": "degraded", "db": "error", "error": str(e)[:200]}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return admission.render_metrics()
+
+
 @app.get("/version")
 def version():
     return {
@@ -136,3 +301,5 @@ app.include_router(events.router, prefix="/v1", tags=["events"])
 app.include_router(articles.router, prefix="/v1", tags=["articles"])
 app.include_router(country.router, prefix="/v1", tags=["country"])
 app.include_router(country_summary.router, prefix="/v1", tags=["country"])
+app.include_router(country_bundle.router, prefix="/v1", tags=["country"])
+app.include_router(search.router, prefix="/v1", tags=["search"])
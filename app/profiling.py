@@ -0,0 +1,107 @@
+import cProfile
+import functools
+import hmac
+import inspect
+import io
+import os
+import pstats
+import time
+from contextvars import ContextVar
+
+from fastapi.routing import APIRoute
+
+PROFILE_HEADER = "x-profile"
+PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "30"))
+
+# Set by the profiling middleware for requests that carry the secret header
+_current: ContextVar[dict | None] = ContextVar("whogoverns_profile", default=None)
+
+
+def is_enabled() -> bool:
+    return os.getenv("PROFILING_ENABLED", "0") == "1" and bool(os.getenv("PROFILE_SECRET"))
+
+
+def is_authorized(header_value: str | None) -> bool:
+    secret = os.getenv("PROFILE_SECRET")
+    if not secret or not header_value:
+        return False
+    return hmac.compare_digest(header_value.encode(), secret.encode())
+
+
+def start() -> tuple[dict, object]:
+    report = {"endpoint_ms": None, "route_ms": None, "call_graph": None}
+    return report, _current.set(report)
+
+
+def stop(token) -> None:
+    _current.reset(token)
+
+
+def _profiled(endpoint):
+    """Run the endpoint under cProfile when the current request is profiled."""
+
+    if inspect.iscoroutinefunction(endpoint):
+        # Must stay a coroutine function so FastAPI awaits it. Only timed:
+        # cProfile on the event loop thread would also record other requests.
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            report = _current.get()
+            if report is None:
+                return await endpoint(*args, **kwargs)
+
+            t0 = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                report["endpoint_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+                report["call_graph"] = "not collected for async endpoints"
+
+        async_wrapper.__profiled__ = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        report = _current.get()
+        if report is None:
+            return endpoint(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        t0 = time.perf_counter()
+        try:
+            return profiler.runcall(endpoint, *args, **kwargs)
+        finally:
+            report["endpoint_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            report["call_graph"] = out.getvalue()
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """
+    APIRoute that can profile its endpoint. Unprofiled requests only pay a
+    context variable lookup.
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        # include_router() re-creates routes from the already wrapped endpoint
+        if not getattr(endpoint, "__profiled__", False):
+            endpoint = _profiled(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request):
+            report = _current.get()
+            if report is None:
+                return await handler(request)
+
+            t0 = time.perf_counter()
+            response = await handler(request)
+            report["route_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+            return response
+
+        return route_handler
@@ -0,0 +1,66 @@
+# Queries shared by the country routers (page, summary, bundle)
+from fastapi import HTTPException
+from psycopg import Connection
+
+POLITICAL_TYPES = [
+    "election",
+    "government_change",
+    "referendum",
+    "constitutional_change",
+    "institutional_crisis",
+    "other_political",
+]
+
+
+def fetch_country(conn: Connection, iso3: str, lang: str) -> dict:
+    """Country header in the requested language; 404 if unknown."""
+    c = conn.execute(
+        """
+        select iso3,
+               case when %(lang)s='fr' then coalesce(name_fr, name_en) else name_en end as name,
+               continent,
+               coverage_status
+        from public.countries
+        where iso3 = %(iso3)s
+        """,
+        {"iso3": iso3, "lang": lang},
+    ).fetchone()
+    if not c:
+        raise HTTPException(status_code=404, detail="Unknown country ISO3")
+
+    return {
+        "iso3": c["iso3"],
+        "name": c["name"],
+        "continent": c["continent"],
+        "coverage_status": c["coverage_status"],
+    }
+
+
+def fetch_political_events(conn: Connection, iso3: str, year: int, limit: int) -> list[dict]:
+    return conn.execute(
+        """
+        select id, country_iso3, year, event_type, title, description, event_date, source_id
+        from public.country_events
+        where country_iso3 = %(iso3)s
+          and year = %(year)s
+          and event_type = any(%(types)s)
+        order by event_date nulls last, id
+        limit %(limit)s
+        """,
+        {"iso3": iso3, "year": year, "types": POLITICAL_TYPES, "limit": limit},
+    ).fetchall()
+
+
+def fetch_articles(conn: Connection, iso3: str, year: int, lang: str, limit: int) -> list[dict]:
+    return conn.execute(
+        """
+        select id, slug, title, lang, country_iso3, year, tags, published_at, created_at
+        from public.articles
+        where lang = %(lang)s
+          and country_iso3 = %(iso3)s
+          and year = %(year)s
+        order by published_at desc nulls last, created_at desc
+        limit %(limit)s
+        """,
+        {"lang": lang, "iso3": iso3, "year": year, "limit": limit},
+    ).fetchall()
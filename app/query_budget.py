@@ -0,0 +1,59 @@
+import os
+import re
+from collections import defaultdict
+
+# off: no tracking; warn: log violations; enforce: also fail the request with 500.
+# Only on when QUERY_BUDGET_MODE is set or ENV is explicitly dev/test, so an
+# instance without ENV (the app's "dev" fallback) never enforces.
+_env = (os.getenv("ENV") or "").lower()
+MODE = (os.getenv("QUERY_BUDGET_MODE") or ("enforce" if _env in ("dev", "test") else "off")).lower()
+
+# Statement text in over-budget 500s only when the mode was chosen explicitly
+SHOW_STATEMENTS = bool(os.getenv("QUERY_BUDGET_MODE"))
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def query_budget(max_queries: int):
+    """
+    Declare how many statements an endpoint may issue per request. Count the
+    bulk segment-cache refresh (app/segments.py) for routes that read it.
+    """
+    def decorator(func):
+        func.__query_budget__ = max_queries
+        return func
+
+    return decorator
+
+
+def budget_of(endpoint) -> int | None:
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def fingerprint(sql: str) -> str:
+    """SQL text with inline literals replaced, to group near-identical statements."""
+    return _LITERALS.sub("?", sql)
+
+
+def analyze(queries: list[dict]) -> dict:
+    """
+    Group statements issued during one request:
+    - duplicates: same SQL and same params, run more than once
+    - repeated: same SQL shape with different params (N+1 candidates)
+    """
+    by_shape = defaultdict(list)
+    for q in queries:
+        by_shape[fingerprint(q["sql"])].append(q)
+
+    duplicates = []
+    repeated = []
+    for shape, group in by_shape.items():
+        if len(group) < 2:
+            continue
+        distinct = {(q["sql"], repr(q["params"])) for q in group}
+        if len(distinct) < len(group):
+            duplicates.append({"sql": shape, "count": len(group)})
+        else:
+            repeated.append({"sql": shape, "count": len(group)})
+
+    return {"count": len(queries), "duplicates": duplicates, "repeated": repeated}
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Query
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.get("/articles")
+@query_budget(1)
 def list_articles(
     iso3: str | None = Query(default=None, min_length=3, max_length=3),
     year: int | None = Query(default=None, ge=1800, le=2100),
@@ -1,9 +1,14 @@
 from fastapi import APIRouter, Query, HTTPException
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.queries import fetch_country
+from app import segments as segments_engine
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.get("/country/{iso3}")
+@query_budget(2)
 def country_page(
     iso3: str,
     year: int = Query(default=2020, ge=1945, le=2025),
@@ -16,66 +21,16 @@ def country_page(
         raise HTTPException(status_code=400, detail="'from' must be <= 'to'")
 
     with get_conn() as conn:
-        # Country
-        c = conn.execute(
-            """
-            select iso3,
-                   case when %(lang)s='fr' then coalesce(name_fr, name_en) else name_en end as name,
-                   continent,
-                   coverage_status
-            from public.countries
-            where iso3 = %(iso3)s
-            """,
-            {"iso3": iso3, "lang": lang},
-        ).fetchone()
+        country = fetch_country(conn, iso3, lang)
 
-        if not c:
-            raise HTTPException(status_code=404, detail="Unknown country ISO3")
-
-        # Timeline (ruling_by_year)
-        rows = conn.execute(
-            """
-            select r.year,
-                   r.coalition,
-                   r.confidence,
-                   r.source_id,
-                   r.leader_name,
-                   p.id as party_id,
-                   p.name as party_name,
-                   p.abbreviation as party_abbr
-            from public.ruling_by_year r
-            left join public.parties p on p.id = r.main_party_id
-            where r.country_iso3 = %(iso3)s
-              and r.year between %(from)s and %(to)s
-            order by r.year
-            """,
-            {"iso3": iso3, "from": from_year, "to": to_year},
-        ).fetchall()
-
-    # Build a compact year->power mapping
-    by_year = {}
-    for r in rows:
-        by_year[r["year"]] = {
-            "leader_name": r["leader_name"],
-            "main_party": None if r["party_id"] is None else {
-                "id": r["party_id"],
-                "name": r["party_name"],
-                "abbr": r["party_abbr"],
-            },
-            "coalition": r["coalition"],
-            "confidence": r["confidence"],
-            "source_id": r["source_id"],
-        }
+    # Build a compact year->power mapping (ruling_by_year rows from the shared cache)
+    country_segments = segments_engine.for_country(iso3)
+    by_year = country_segments.by_year(from_year, to_year)
 
     selected = by_year.get(year)
 
     return {
-        "country": {
-            "iso3": c["iso3"],
-            "name": c["name"],
-            "continent": c["continent"],
-            "coverage_status": c["coverage_status"],
-        },
+        "country": country,
         "range": {"from": from_year, "to": to_year},
         "selected_year": year,
         "selected": selected,
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Query
+from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.queries import fetch_country, fetch_political_events, fetch_articles
+from app import segments as segments_engine
+
+router = APIRouter(route_class=ProfiledRoute)
+
+
+@router.get("/country/{iso3}/bundle")
+@query_budget(4)
+def country_bundle(
+    iso3: str,
+    year: int = Query(default=2020, ge=1945, le=2025),
+    lang: str = Query(default="en", pattern="^(en|fr)$"),
+    events_limit: int = Query(default=20, ge=1, le=100),
+    articles_limit: int = Query(default=10, ge=1, le=50),
+):
+    """
+    Everything a country page needs in one response: country, full year map,
+    compressed segments, and the selected year's events and articles.
+    """
+    iso3 = iso3.upper()
+
+    with get_conn() as conn:
+        country = fetch_country(conn, iso3, lang)
+        ev = fetch_political_events(conn, iso3, year, events_limit)
+        ar = fetch_articles(conn, iso3, year, lang, articles_limit)
+
+    # Full range, from the shared ruling_by_year cache
+    country_segments = segments_engine.for_country(iso3)
+    by_year = country_segments.by_year(1945, 2025)
+
+    return {
+        "country": country,
+        "range": {"from": 1945, "to": 2025},
+        "selected_year": year,
+        "selected": by_year.get(year),
+        "by_year": by_year,
+        "segments": country_segments.segments_between(1945, 2025),
+        "events": {"count": len(ev), "events": ev},
+        "articles": {"count": len(ar), "articles": ar},
+    }
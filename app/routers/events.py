@@ -1,18 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.queries import POLITICAL_TYPES
 
-router = APIRouter()
-
-POLITICAL_TYPES = {
-    "election",
-    "government_change",
-    "referendum",
-    "constitutional_change",
-    "institutional_crisis",
-    "other_political",
-}
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.get("/events")
+@query_budget(1)
 def events(
     iso3: str = Query(..., min_length=3, max_length=3),
     year: int = Query(..., ge=1800, le=2100),
@@ -30,39 +25,36 @@ def events(
             raise HTTPException(status_code=400, detail=f"Invalid event_types: {bad}")
         selected_types = parts
 
+    # Country existence check folded into the events query: no row means
+    # unknown country, a single all-null event row means no events.
     with get_conn() as conn:
-        exists = conn.execute(
-            "select 1 from public.countries where iso3 = %(iso3)s",
-            {"iso3": iso3},
-        ).fetchone()
-        if not exists:
-            raise HTTPException(status_code=404, detail="Unknown country ISO3")
-
-        if selected_types:
-            rows = conn.execute(
-                """
-                select id, country_iso3, year, event_type, title, description, event_date, source_id
-                from public.country_events
-                where country_iso3 = %(iso3)s
-                  and year = %(year)s
-                  and event_type = any(%(types)s)
-                order by event_date nulls last, id
-                limit %(limit)s
-                """,
-                {"iso3": iso3, "year": year, "types": selected_types, "limit": limit},
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """
+        found = conn.execute(
+            """
+            select c.iso3 as known_iso3,
+                   e.id, e.country_iso3, e.year, e.event_type, e.title, e.description, e.event_date, e.source_id
+            from public.countries c
+            left join lateral (
                 select id, country_iso3, year, event_type, title, description, event_date, source_id
                 from public.country_events
-                where country_iso3 = %(iso3)s
+                where country_iso3 = c.iso3
                   and year = %(year)s
                   and event_type = any(%(types)s)
                 order by event_date nulls last, id
                 limit %(limit)s
-                """,
-                {"iso3": iso3, "year": year, "types": list(POLITICAL_TYPES), "limit": limit},
-            ).fetchall()
+            ) e on true
+            where c.iso3 = %(iso3)s
+            order by e.event_date nulls last, e.id
+            """,
+            {"iso3": iso3, "year": year, "types": selected_types or POLITICAL_TYPES, "limit": limit},
+        ).fetchall()
+
+    if not found:
+        raise HTTPException(status_code=404, detail="Unknown country ISO3")
+
+    rows = []
+    for r in found:
+        if r["id"] is not None:
+            r.pop("known_iso3")
+            rows.append(r)
 
     return {"iso3": iso3, "year": year, "count": len(rows), "events": rows, "allowed_types": sorted(POLITICAL_TYPES)}
@@ -1,9 +1,14 @@
 from fastapi import APIRouter, Query
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.cache import ttl_cache
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.get("/map")
+@query_budget(1)
+@ttl_cache(3600)
 def map_data(
     year: int = Query(..., ge=1945, le=2025),
     continent: str | None = Query(default=None, pattern="^(AF|AN|AS|EU|NA|OC|SA)$"),
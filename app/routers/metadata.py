@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Query
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.cache import ttl_cache
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 CONTINENTS = [
     {"code": "AF", "name_en": "Africa",         "name_fr": "Afrique"},
@@ -14,6 +17,8 @@ CONTINENTS = [
 ]
 
 @router.get("/metadata")
+@query_budget(2)
+@ttl_cache(86400)
 def metadata(lang: str = Query(default="en", pattern="^(en|fr)$")):
     with get_conn() as conn:
         cov = conn.execute(
@@ -0,0 +1,156 @@
+import base64
+import json
+
+from fastapi import APIRouter, Query, HTTPException
+from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app.queries import POLITICAL_TYPES
+
+router = APIRouter(route_class=ProfiledRoute)
+
+# lang -> (tsvector column, text search config); see sql/001_search.sql
+SEARCH_CONFIGS = {
+    "en": ("search_en", "english"),
+    "fr": ("search_fr", "french"),
+}
+
+
+def _encode_cursor(rank: float, kind: str, key: str) -> str:
+    raw = json.dumps([rank, kind, key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[float, str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        rank, kind, key = json.loads(raw)
+        return float(rank), str(kind), str(key)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def build_search_sql(
+    q: str,
+    lang: str,
+    iso3: str | None = None,
+    year: int | None = None,
+    type: str | None = None,
+    limit: int = 20,
+    after: tuple[float, str, str] | None = None,
+) -> tuple[str, dict]:
+    """SQL and params for one search page (also used by tests/bench_search.py)."""
+    column, config = SEARCH_CONFIGS[lang]
+
+    params = {
+        "q": q,
+        "config": config,
+        "lang": lang,
+        "types": sorted(POLITICAL_TYPES),
+        "limit": limit + 1,
+    }
+
+    article_where = [f"a.{column} @@ q.query", "a.lang = %(lang)s"]
+    event_where = [f"e.{column} @@ q.query", "e.event_type = any(%(types)s)"]
+
+    if iso3:
+        article_where.append("a.country_iso3 = %(iso3)s")
+        event_where.append("e.country_iso3 = %(iso3)s")
+        params["iso3"] = iso3
+    if year is not None:
+        article_where.append("a.year = %(year)s")
+        event_where.append("e.year = %(year)s")
+        params["year"] = year
+
+    branches = []
+    if type in (None, "article"):
+        branches.append(
+            f"""
+            select 'article' as kind,
+                   a.id::text as key,
+                   ts_rank(a.{column}, q.query) as rank,
+                   jsonb_build_object(
+                     'id', a.id, 'slug', a.slug, 'title', a.title, 'lang', a.lang,
+                     'country_iso3', a.country_iso3, 'year', a.year, 'tags', a.tags,
+                     'published_at', a.published_at
+                   ) as item
+            from public.articles a, q
+            where {" and ".join(article_where)}
+            """
+        )
+    if type in (None, "event"):
+        branches.append(
+            f"""
+            select 'event' as kind,
+                   e.id::text as key,
+                   ts_rank(e.{column}, q.query) as rank,
+                   jsonb_build_object(
+                     'id', e.id, 'country_iso3', e.country_iso3, 'year', e.year,
+                     'event_type', e.event_type, 'title', e.title,
+                     'description', e.description, 'event_date', e.event_date,
+                     'source_id', e.source_id
+                   ) as item
+            from public.country_events e, q
+            where {" and ".join(event_where)}
+            """
+        )
+
+    # Keyset pagination on (rank desc, kind, key)
+    after_sql = ""
+    if after:
+        params["c_rank"], params["c_kind"], params["c_key"] = after
+        after_sql = """
+            where s.rank < %(c_rank)s::real
+               or (s.rank = %(c_rank)s::real and (s.kind, s.key) > (%(c_kind)s, %(c_key)s))
+        """
+
+    sql = f"""
+        with q as (select websearch_to_tsquery(%(config)s::regconfig, %(q)s) as query)
+        select s.kind, s.key, s.rank, s.item
+        from ({" union all ".join(branches)}) s
+        {after_sql}
+        order by s.rank desc, s.kind, s.key
+        limit %(limit)s
+    """
+    return sql, params
+
+
+@router.get("/search")
+@query_budget(1)
+def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    lang: str = Query(default="en", pattern="^(en|fr)$"),
+    iso3: str | None = Query(default=None, min_length=3, max_length=3),
+    year: int | None = Query(default=None, ge=1800, le=2100),
+    type: str | None = Query(default=None, pattern="^(article|event)$"),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=500),
+):
+    """
+    Ranked full-text search over article titles/tags and political event
+    titles/descriptions. Paginate with the returned `next_cursor`.
+    """
+    iso3 = iso3.upper() if iso3 else None
+    after = _decode_cursor(cursor) if cursor else None
+    sql, params = build_search_sql(q, lang, iso3=iso3, year=year, type=type, limit=limit, after=after)
+
+    with get_conn() as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor(last["rank"], last["kind"], last["key"])
+
+    return {
+        "q": q,
+        "lang": lang,
+        "filters": {"iso3": iso3, "year": year, "type": type},
+        "count": len(rows),
+        "results": [
+            {"type": r["kind"], "rank": r["rank"], "item": r["item"]}
+            for r in rows
+        ],
+        "next_cursor": next_cursor,
+    }
@@ -1,17 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 from app.db import get_conn
+from app.profiling import ProfiledRoute
+from app.query_budget import query_budget
+from app import segments as segments_engine
 
-router = APIRouter()
-
-def _same_power(a: dict, b: dict) -> bool:
-    # Compare what matters for timeline grouping
-    return (
-        a.get("party_id") == b.get("party_id")
-        and a.get("coalition") == b.get("coalition")
-        and a.get("leader_name") == b.get("leader_name")
-    )
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.get("/timeline/{iso3}")
+@query_budget(2)
 def timeline(
     iso3: str,
     from_year: int = Query(default=1945, alias="from", ge=1800, le=2100),
@@ -42,76 +38,10 @@ def timeline(
         if not c:
             raise HTTPException(status_code=404, detail="Unknown country ISO3")
 
-        rows = conn.execute(
-            """
-            select r.year,
-                   r.coalition,
-                   r.confidence,
-                   r.source_id,
-                   r.leader_name,
-                   p.id as party_id,
-                   p.name as party_name,
-                   p.abbreviation as party_abbr
-            from public.ruling_by_year r
-            left join public.parties p on p.id = r.main_party_id
-            where r.country_iso3 = %(iso3)s
-              and r.year between %(from)s and %(to)s
-            order by r.year
-            """,
-            {"iso3": iso3, "from": from_year, "to": to_year},
-        ).fetchall()
-
-    # Build year records list (only years present in table)
-    years = []
-    for r in rows:
-        years.append({
-            "year": r["year"],
-            "leader_name": r["leader_name"],
-            "party_id": r["party_id"],
-            "party": None if r["party_id"] is None else {
-                "id": r["party_id"],
-                "name": r["party_name"],
-                "abbr": r["party_abbr"],
-            },
-            "coalition": r["coalition"],
-            "confidence": r["confidence"],
-            "source_id": r["source_id"],
-        })
-
-    # Compress consecutive years with same party+coalition
-    segments = []
-    if years:
-        cur = years[0]
-        seg_start = cur["year"]
-        seg_end = cur["year"]
-
-        for item in years[1:]:
-            if item["year"] == seg_end + 1 and _same_power(cur, item):
-                seg_end = item["year"]
-            else:
-                segments.append({
-                    "start_year": seg_start,
-                    "end_year": seg_end,
-                    "leader_name": cur.get("leader_name"),
-                    "main_party": cur["party"],
-                    "coalition": cur["coalition"],
-                    "confidence": cur["confidence"],
-                    "source_id": cur["source_id"],
-                })
-                cur = item
-                seg_start = item["year"]
-                seg_end = item["year"]
-
-        # last segment
-        segments.append({
-            "start_year": seg_start,
-            "end_year": seg_end,
-            "leader_name": cur.get("leader_name"),
-            "main_party": cur["party"],
-            "coalition": cur["coalition"],
-            "confidence": cur["confidence"],
-            "source_id": cur["source_id"],
-        })
+    # Compressed segments come from the shared per-country cache, clipped to the
+    # range. No response cache on top: staleness stays bounded by that cache.
+    country_segments = segments_engine.for_country(c["iso3"])
+    segments = country_segments.segments_between(from_year, to_year)
 
     resp = {
         "country": {
@@ -125,6 +55,22 @@ def timeline(
     }
 
     if include_years:
-        resp["years"] = years
+        # Year records list (only years present in table)
+        resp["years"] = [
+            {
+                "year": r["year"],
+                "leader_name": r["leader_name"],
+                "party_id": r["party_id"],
+                "party": None if r["party_id"] is None else {
+                    "id": r["party_id"],
+                    "name": r["party_name"],
+                    "abbr": r["party_abbr"],
+                },
+                "coalition": r["coalition"],
+                "confidence": r["confidence"],
+                "source_id": r["source_id"],
+            }
+            for r in country_segments.rows_between(from_year, to_year)
+        ]
 
     return resp
@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+
+from app.db import get_conn
+
+# Stale-while-revalidate: data is at most CACHE_TTL_S plus one reload old
+CACHE_TTL_S = 3600
+
+ALL_RULING_SQL = """
+    select r.country_iso3,
+           r.year,
+           r.coalition,
+           r.confidence,
+           r.source_id,
+           r.leader_name,
+           p.id as party_id,
+           p.name as party_name,
+           p.abbreviation as party_abbr
+    from public.ruling_by_year r
+    left join public.parties p on p.id = r.main_party_id
+    order by r.country_iso3, r.year
+"""
+
+
+def power_of(row: dict) -> dict:
+    """Public power payload for a ruling_by_year row (without the year)."""
+    return {
+        "leader_name": row["leader_name"],
+        "main_party": None if row["party_id"] is None else {
+            "id": row["party_id"],
+            "name": row["party_name"],
+            "abbr": row["party_abbr"],
+        },
+        "coalition": row["coalition"],
+        "confidence": row["confidence"],
+        "source_id": row["source_id"],
+    }
+
+
+class CountrySegments:
+    """
+    Year rows of one country: the row dicts, their years as a sorted column
+    for bisecting, and the row-index bounds of each run of consecutive years
+    with the same party, coalition and leader.
+    """
+
+    __slots__ = ("years", "rows", "starts", "ends")
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.years = [r["year"] for r in rows]
+        self.starts = []
+        self.ends = []
+
+        if not rows:
+            return
+
+        party_ids = [r["party_id"] for r in rows]
+        coalitions = [r["coalition"] for r in rows]
+        leaders = [r["leader_name"] for r in rows]
+
+        self.starts.append(0)
+        for i in range(1, len(rows)):
+            if (
+                self.years[i] != self.years[i - 1] + 1
+                or party_ids[i] != party_ids[i - 1]
+                or coalitions[i] != coalitions[i - 1]
+                or leaders[i] != leaders[i - 1]
+            ):
+                self.ends.append(i - 1)
+                self.starts.append(i)
+        self.ends.append(len(rows) - 1)
+
+    def _bounds(self, from_year: int, to_year: int) -> tuple[int, int]:
+        return bisect_left(self.years, from_year), bisect_right(self.years, to_year)
+
+    def rows_between(self, from_year: int, to_year: int) -> list[dict]:
+        lo, hi = self._bounds(from_year, to_year)
+        return self.rows[lo:hi]
+
+    def by_year(self, from_year: int, to_year: int) -> dict[int, dict]:
+        return {r["year"]: power_of(r) for r in self.rows_between(from_year, to_year)}
+
+    def at(self, year: int) -> dict | None:
+        i = bisect_left(self.years, year)
+        if i < len(self.years) and self.years[i] == year:
+            return self.rows[i]
+        return None
+
+    def segments_between(self, from_year: int, to_year: int) -> list[dict]:
+        """
+        Segments clipped to [from_year, to_year]. A segment cut at its start
+        takes its attributes from the first in-range year, which matches
+        compressing only the in-range rows.
+        """
+        lo, hi = self._bounds(from_year, to_year)
+        if lo >= hi:
+            return []
+
+        first = bisect_right(self.starts, lo) - 1
+        last = bisect_right(self.starts, hi - 1) - 1
+
+        segments = []
+        for k in range(first, last + 1):
+            start = max(self.starts[k], lo)
+            end = min(self.ends[k], hi - 1)
+            segments.append({
+                "start_year": self.years[start],
+                "end_year": self.years[end],
+                **power_of(self.rows[start]),
+            })
+        return segments
+
+
+_EMPTY = CountrySegments([])
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_cache: dict = {"expires": 0.0, "countries": None}
+
+logger = logging.getLogger("whogoverns.segments")
+
+
+def build_all(rows: list[dict]) -> dict[str, CountrySegments]:
+    """Bulk pass over rows ordered by (country_iso3, year)."""
+    countries = {}
+    if not rows:
+        return countries
+
+    start = 0
+    for i in range(1, len(rows) + 1):
+        if i == len(rows) or rows[i]["country_iso3"] != rows[start]["country_iso3"]:
+            countries[rows[start]["country_iso3"]] = CountrySegments(rows[start:i])
+            start = i
+    return countries
+
+
+def _refresh() -> None:
+    """Reload all countries; the DB round-trip and build run outside _lock."""
+    with get_conn() as conn:
+        rows = conn.execute(ALL_RULING_SQL).fetchall()
+    countries = build_all(rows)
+
+    with _lock:
+        _cache["countries"] = countries
+        _cache["expires"] = time.monotonic() + CACHE_TTL_S
+
+
+def _refresh_in_background() -> None:
+    try:
+        _refresh()
+    except Exception as e:
+        logger.warning("segments: refresh failed, serving stale data: %s", str(e)[:200])
+    finally:
+        _refresh_lock.release()
+
+
+def for_country(iso3: str) -> CountrySegments:
+    """
+    Cached segments for a country. Once loaded, expired data keeps being
+    served while a single background thread reloads all countries; only the
+    very first load blocks callers.
+    """
+    with _lock:
+        countries = _cache["countries"]
+        expired = _cache["expires"] <= time.monotonic()
+
+    if countries is None:
+        with _refresh_lock:
+            with _lock:
+                loaded = _cache["countries"] is not None
+            if not loaded:
+                _refresh()
+        with _lock:
+            countries = _cache["countries"]
+    elif expired and _refresh_lock.acquire(blocking=False):
+        threading.Thread(target=_refresh_in_background, daemon=True).start()
+
+    return countries.get(iso3, _EMPTY)
+
+
+def cache_clear() -> None:
+    with _lock:
+        _cache["expires"] = 0.0
+        _cache["countries"] = None
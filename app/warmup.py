@@ -0,0 +1,149 @@
+import logging
+import os
+import re
+import threading
+from collections import Counter
+
+from app.routers.map import map_data
+from app.routers.metadata import metadata
+from app.routers.timeline import timeline
+
+logger = logging.getLogger("whogoverns.warmup")
+
+YEARS = range(1945, 2026)
+LANGS = ("en", "fr")
+
+# Matches the request_logging line format in app/main.py
+_COUNTRY_PATH = re.compile(r"path=/v1/(?:timeline|country)/([A-Za-z]{3})\b")
+
+# failed: map/metadata calls still failing after the last attempt (gates readiness);
+# timeline_failed: best-effort country timelines that failed (does not)
+state = {"ready": False, "attempts": 0, "warmed": 0, "failed": 0, "timeline_failed": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("warmup: invalid %s=%r, using %s", name, value, default)
+        return default
+
+
+def _tail_lines(path: str, max_lines: int, block_size: int = 64 * 1024) -> list[str]:
+    """Last `max_lines` lines of a file, reading backwards from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= max_lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").splitlines()[-max_lines:]
+
+
+def top_countries() -> list[str]:
+    """
+    Countries to preload: WARMUP_COUNTRIES (comma-separated ISO3) if set,
+    otherwise the WARMUP_TOP_N most requested ones in the last
+    WARMUP_ACCESS_LOG_LINES lines of WARMUP_ACCESS_LOG.
+    """
+    configured = os.getenv("WARMUP_COUNTRIES")
+    if configured:
+        return [c.strip().upper() for c in configured.split(",") if c.strip()]
+
+    log_path = os.getenv("WARMUP_ACCESS_LOG")
+    if not log_path:
+        return []
+
+    top_n = _env_int("WARMUP_TOP_N", 20)
+    max_lines = _env_int("WARMUP_ACCESS_LOG_LINES", 50000)
+    try:
+        lines = _tail_lines(log_path, max_lines)
+    except OSError as e:
+        logger.warning("warmup: cannot read access log %s: %s", log_path, e)
+        return []
+
+    counts = Counter()
+    for line in lines:
+        m = _COUNTRY_PATH.search(line)
+        if m:
+            counts[m.group(1).upper()] += 1
+
+    return [iso3 for iso3, _ in counts.most_common(top_n)]
+
+
+def _warm(label: str, fn, **kwargs) -> bool:
+    try:
+        fn(**kwargs)
+        state["warmed"] += 1
+        return True
+    except Exception as e:
+        logger.warning("warmup: %s failed: %s", label, str(e)[:200])
+        return False
+
+
+def _core_items() -> list[tuple]:
+    items = []
+    for lang in LANGS:
+        items.append((f"metadata lang={lang}", metadata, {"lang": lang}))
+        for year in YEARS:
+            items.append((
+                f"map year={year} lang={lang}",
+                map_data,
+                {"year": year, "continent": None, "group": None, "covered_only": False, "lang": lang},
+            ))
+    return items
+
+
+def run(stop: threading.Event | None = None) -> None:
+    """
+    Preload the response caches. Called once from the app lifespan.
+
+    Map and metadata calls are retried every WARMUP_RETRY_S seconds until at
+    most WARMUP_MAX_FAILURES of them fail; only then is the instance ready.
+    Country timelines are best effort, so a bad country list never blocks it.
+    """
+    stop = stop or threading.Event()
+    max_failures = _env_int("WARMUP_MAX_FAILURES", 0)
+    retry_s = _env_int("WARMUP_RETRY_S", 10)
+
+    pending = _core_items()
+    while True:
+        state["attempts"] += 1
+        pending = [item for item in pending if not _warm(item[0], item[1], **item[2])]
+        state["failed"] = len(pending)
+        if len(pending) <= max_failures:
+            break
+        logger.warning(
+            "warmup: %s map/metadata calls failed (attempt %s), retrying in %ss",
+            len(pending), state["attempts"], retry_s,
+        )
+        if stop.wait(retry_s):
+            return
+
+    try:
+        countries = top_countries()
+    except Exception as e:
+        logger.warning("warmup: cannot determine top countries: %s", str(e)[:200])
+        countries = []
+
+    for iso3 in countries:
+        for lang in LANGS:
+            ok = _warm(
+                f"timeline iso3={iso3} lang={lang}",
+                timeline,
+                iso3=iso3, from_year=1945, to_year=2025, lang=lang, include_years=False,
+            )
+            if not ok:
+                state["timeline_failed"] += 1
+
+    state["ready"] = True
+    logger.info(
+        "warmup: done warmed=%s failed=%s timeline_failed=%s",
+        state["warmed"], state["failed"], state["timeline_failed"],
+    )
@@ -0,0 +1,63 @@
+-- Full-text search over articles and country events (/v1/search).
+--
+-- Each table gets one tsvector column per supported `lang` (en, fr), kept in
+-- sync by a trigger, and a GIN index on each column so lookups only touch the
+-- posting lists of the query terms instead of scanning the table.
+
+-- -----------------------------
+-- Articles: title + tags
+-- -----------------------------
+alter table public.articles
+  add column if not exists search_en tsvector,
+  add column if not exists search_fr tsvector;
+
+create or replace function public.articles_search_update() returns trigger as $$
+begin
+  new.search_en :=
+    setweight(to_tsvector('english', coalesce(new.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(array_to_string(new.tags, ' '), '')), 'B');
+  new.search_fr :=
+    setweight(to_tsvector('french', coalesce(new.title, '')), 'A')
+    || setweight(to_tsvector('french', coalesce(array_to_string(new.tags, ' '), '')), 'B');
+  return new;
+end
+$$ language plpgsql;
+
+drop trigger if exists articles_search_update on public.articles;
+create trigger articles_search_update
+  before insert or update of title, tags on public.articles
+  for each row execute function public.articles_search_update();
+
+update public.articles set title = title;
+
+create index if not exists articles_search_en_idx on public.articles using gin (search_en);
+create index if not exists articles_search_fr_idx on public.articles using gin (search_fr);
+
+-- -----------------------------
+-- Country events: title + description
+-- -----------------------------
+alter table public.country_events
+  add column if not exists search_en tsvector,
+  add column if not exists search_fr tsvector;
+
+create or replace function public.country_events_search_update() returns trigger as $$
+begin
+  new.search_en :=
+    setweight(to_tsvector('english', coalesce(new.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(new.description, '')), 'B');
+  new.search_fr :=
+    setweight(to_tsvector('french', coalesce(new.title, '')), 'A')
+    || setweight(to_tsvector('french', coalesce(new.description, '')), 'B');
+  return new;
+end
+$$ language plpgsql;
+
+drop trigger if exists country_events_search_update on public.country_events;
+create trigger country_events_search_update
+  before insert or update of title, description on public.country_events
+  for each row execute function public.country_events_search_update();
+
+update public.country_events set title = title;
+
+create index if not exists country_events_search_en_idx on public.country_events using gin (search_en);
+create index if not exists country_events_search_fr_idx on public.country_events using gin (search_fr);
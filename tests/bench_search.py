@@ -0,0 +1,141 @@
+"""
+Benchmark: /v1/search latency as the searched tables grow.
+
+Inside one transaction that is rolled back at the end, grows articles and
+country_events to each requested multiple of their current size with
+synthetic non-matching rows, and runs the exact SQL built by
+app/routers/search.py under EXPLAIN (ANALYZE, BUFFERS) at every size. With
+the GIN indexes the work tracks the number of matches, so the gin column
+should stay flat while the seqscan column (index scans disabled) grows with
+the tables.
+
+Needs DATABASE_URL with sql/001_search.sql applied. Nothing is committed.
+
+    python -m tests.bench_search [term ...] [--scales 1,10,100] [--lang en|fr] [--runs N]
+"""
+import argparse
+import statistics
+
+from dotenv import load_dotenv
+from psycopg import ClientCursor, Rollback
+
+from app.db import get_conn
+from app.routers.search import build_search_sql
+
+DEFAULT_TERMS = ["coup", "referendum", "election", "constitution"]
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def explain(conn, sql: str, params: dict, seqscan: bool) -> dict:
+    cur = ClientCursor(conn)
+    # Savepoint rolled back so SET LOCAL does not leak into later runs
+    with conn.transaction() as tx:
+        if seqscan:
+            cur.execute("set local enable_bitmapscan = off")
+            cur.execute("set local enable_indexscan = off")
+        cur.execute("explain (analyze, buffers, format json) " + sql, params)
+        out = cur.fetchone()
+        raise Rollback(tx)
+    doc = out["QUERY PLAN"][0] if isinstance(out, dict) else out[0][0]
+
+    nodes = list(_walk(doc["Plan"]))
+    return {
+        "execution_ms": doc["Execution Time"],
+        "indexes": sorted({n["Index Name"] for n in nodes if "Index Name" in n}),
+        "buffers": doc["Plan"].get("Shared Hit Blocks", 0) + doc["Plan"].get("Shared Read Blocks", 0),
+    }
+
+
+def row_counts(conn) -> dict:
+    return conn.execute(
+        """
+        select (select count(*) from public.articles)::bigint as articles,
+               (select count(*) from public.country_events)::bigint as country_events
+        """
+    ).fetchone()
+
+
+def grow(conn, base: dict, factor: int, current: dict) -> None:
+    """Insert synthetic rows (copied keys, filler text) up to factor x base."""
+    for table, sql in (
+        (
+            "articles",
+            """
+            insert into public.articles (slug, title, lang, country_iso3, year, tags, published_at)
+            select a.slug || '-bench-' || g || '-' || a.id,
+                   'bench filler ' || md5(g::text || a.id::text),
+                   a.lang, a.country_iso3, a.year, '{}', a.published_at
+            from public.articles a
+            cross join generate_series(1, %(copies)s) g
+            where a.slug not like '%%-bench-%%'
+            """,
+        ),
+        (
+            "country_events",
+            """
+            insert into public.country_events (country_iso3, year, event_type, title, description, event_date, source_id)
+            select e.country_iso3, e.year, e.event_type,
+                   'bench filler ' || md5(g::text || e.id::text),
+                   'synthetic row for search benchmark',
+                   e.event_date, e.source_id
+            from public.country_events e
+            cross join generate_series(1, %(copies)s) g
+            where e.title not like 'bench filler %%'
+            """,
+        ),
+    ):
+        missing = base[table] * factor - current[table]
+        if missing > 0 and base[table]:
+            conn.execute(sql, {"copies": missing // base[table]})
+    conn.execute("analyze public.articles")
+    conn.execute("analyze public.country_events")
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("terms", nargs="*", default=DEFAULT_TERMS)
+    parser.add_argument("--scales", default="1,10,100")
+    parser.add_argument("--lang", default="en", choices=["en", "fr"])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    scales = sorted(int(s) for s in args.scales.split(","))
+
+    header = f"{'scale':>6}{'articles':>10}{'events':>10}  {'term':<14}{'gin_ms':>9}{'seqscan_ms':>12}{'buffers':>9}  indexes"
+    print(header)
+    print("-" * len(header))
+
+    used_gin = False
+    with get_conn() as conn:
+        with conn.transaction() as outer:
+            base = row_counts(conn)
+            for factor in scales:
+                grow(conn, base, factor, row_counts(conn))
+                counts = row_counts(conn)
+
+                for term in args.terms:
+                    sql, params = build_search_sql(term, args.lang)
+                    gin = [explain(conn, sql, params, seqscan=False) for _ in range(args.runs)]
+                    seq = [explain(conn, sql, params, seqscan=True) for _ in range(args.runs)]
+                    used_gin = used_gin or bool(gin[-1]["indexes"])
+                    print(
+                        f"{factor:>5}x{counts['articles']:>10}{counts['country_events']:>10}  {term:<14}"
+                        f"{statistics.median(r['execution_ms'] for r in gin):>9.3f}"
+                        f"{statistics.median(r['execution_ms'] for r in seq):>12.3f}"
+                        f"{gin[-1]['buffers']:>9}  {','.join(gin[-1]['indexes'])}"
+                    )
+
+            # Never keep the synthetic rows
+            raise Rollback(outer)
+
+    if not used_gin:
+        print("\nwarning: no GIN index used; has sql/001_search.sql been applied?")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Micro-benchmark: cached CountrySegments vs the original per-request
+run-length loop, for full-range and partial-range requests.
+
+    python -m tests.bench_segments [--number N]
+"""
+import argparse
+import timeit
+
+from app.segments import CountrySegments
+
+from tests.segments_reference import reference_segments
+
+
+def _rows() -> list[dict]:
+    # 81 years with a change of government roughly every 5 years
+    return [
+        {
+            "country_iso3": "FRA",
+            "year": year,
+            "party_id": year // 5,
+            "party_name": f"Party {year // 5}",
+            "party_abbr": f"P{year // 5}",
+            "coalition": False,
+            "leader_name": f"Leader {year // 5}",
+            "confidence": "high",
+            "source_id": 1,
+        }
+        for year in range(1945, 2026)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = _rows()
+    cached = CountrySegments(rows)
+
+    for from_year, to_year in ((1945, 2025), (1990, 2000)):
+        in_range = [r for r in rows if from_year <= r["year"] <= to_year]
+        old = timeit.timeit(lambda: reference_segments(in_range), number=args.number)
+        new = timeit.timeit(lambda: cached.segments_between(from_year, to_year), number=args.number)
+        print(
+            f"{from_year}-{to_year}: reference {old / args.number * 1e6:.2f} us, "
+            f"cached {new / args.number * 1e6:.2f} us ({old / new:.1f}x)"
+        )
+
+    build = timeit.timeit(lambda: CountrySegments(rows), number=args.number // 10)
+    print(f"build one country: {build / (args.number // 10) * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import db, segments
+from app.main import app
+from app.routers import map as map_router, metadata
+
+
+class FakeRow(dict):
+    """Row where every missing column reads as NULL."""
+
+    def __missing__(self, key):
+        return None
+
+
+class FakeResult:
+    def fetchone(self):
+        return FakeRow(iso3="FRA", known_iso3="FRA")
+
+    def fetchall(self):
+        return [FakeRow(iso3="FRA", known_iso3="FRA")]
+
+
+class FakeConnection:
+    """Stands in for get_conn(): records statements like TrackedCursor does."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        entry = {"sql": " ".join(str(query).split()), "params": params, "duration_ms": 0.0, "rows": 1}
+        for log in db._query_logs.get():
+            log.append(entry)
+        return FakeResult()
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Patch get_conn everywhere it was imported and start from cold caches."""
+    real_get_conn = db.get_conn
+    for name, module in list(sys.modules.items()):
+        if (name == "app" or name.startswith("app.")) and getattr(module, "get_conn", None) is real_get_conn:
+            monkeypatch.setattr(module, "get_conn", FakeConnection)
+
+    segments.cache_clear()
+    for endpoint in (map_router.map_data, metadata.metadata):
+        endpoint.cache_clear()
+    yield
+    segments.cache_clear()
+
+
+@pytest.fixture
+def client(fake_db):
+    # Not used as a context manager, so the lifespan warm-up does not run
+    return TestClient(app)
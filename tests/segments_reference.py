@@ -0,0 +1,64 @@
+# Original per-request run-length compression from app/routers/timeline.py
+# (before app/segments.py), kept as the reference for tests and benchmarks.
+import random
+
+
+def _same_power(a: dict, b: dict) -> bool:
+    return (
+        a.get("party_id") == b.get("party_id")
+        and a.get("coalition") == b.get("coalition")
+        and a.get("leader_name") == b.get("leader_name")
+    )
+
+
+def reference_segments(years: list[dict]) -> list[dict]:
+    segments = []
+    if not years:
+        return segments
+
+    def segment(cur, start, end):
+        return {
+            "start_year": start,
+            "end_year": end,
+            "leader_name": cur["leader_name"],
+            "main_party": None if cur["party_id"] is None else {
+                "id": cur["party_id"],
+                "name": cur["party_name"],
+                "abbr": cur["party_abbr"],
+            },
+            "coalition": cur["coalition"],
+            "confidence": cur["confidence"],
+            "source_id": cur["source_id"],
+        }
+
+    cur = years[0]
+    seg_start = seg_end = cur["year"]
+    for item in years[1:]:
+        if item["year"] == seg_end + 1 and _same_power(cur, item):
+            seg_end = item["year"]
+        else:
+            segments.append(segment(cur, seg_start, seg_end))
+            cur = item
+            seg_start = seg_end = item["year"]
+    segments.append(segment(cur, seg_start, seg_end))
+    return segments
+
+
+def random_rows(rng: random.Random, iso3: str = "FRA") -> list[dict]:
+    """ruling_by_year-shaped rows over a random, gapped set of years."""
+    years = sorted(rng.sample(range(1940, 2030), rng.randint(0, 60)))
+    rows = []
+    for year in years:
+        party_id = rng.choice([None, 1, 2])
+        rows.append({
+            "country_iso3": iso3,
+            "year": year,
+            "party_id": party_id,
+            "party_name": None if party_id is None else f"Party {party_id}",
+            "party_abbr": None if party_id is None else f"P{party_id}",
+            "coalition": rng.choice([True, False, False, False]),
+            "leader_name": rng.choice(["A", "A", "B", None]),
+            "confidence": rng.choice(["high", "medium", "low"]),
+            "source_id": rng.randint(1, 3),
+        })
+    return rows
@@ -0,0 +1,54 @@
+import asyncio
+import re
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app import admission
+from app.main import app
+
+
+def test_every_v1_route_has_its_own_budget():
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path.startswith("/v1"):
+            path = re.sub(r"\{[^}]+\}", "FRA", route.path)
+            assert admission.budget_for(path).name != "default", route.path
+
+
+def test_health_bypasses_admission():
+    for path in ("/health", "/health/ready", "/health/db", "/version", "/metrics"):
+        assert admission.budget_for(path) is None
+
+
+def test_limits_are_configurable_per_route(monkeypatch):
+    monkeypatch.setenv("ADMISSION_SEARCH_MAX_CONCURRENT", "2")
+    monkeypatch.setenv("ADMISSION_SEARCH_MAX_QUEUE", "3")
+
+    budget = admission._budget("search", 4, 8)
+
+    assert (budget.max_concurrent, budget.max_queue) == (2, 3)
+
+
+def test_full_queue_is_shed():
+    async def scenario():
+        budget = admission.Budget("t", max_concurrent=1, max_queue=1, queue_timeout=1.0)
+        await budget.acquire()
+        waiter = asyncio.create_task(budget.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(admission.Shed):
+            await budget.acquire()
+        assert (budget.waiting, budget.shed_total) == (1, 1)
+
+        budget.release()
+        await waiter
+        budget.release()
+        assert budget.admitted_total == 2
+
+    asyncio.run(scenario())
+
+
+def test_metrics_export_queue_limit():
+    text = admission.render_metrics()
+    assert 'whogoverns_admission_queue_limit{budget="search"}' in text
+    assert 'whogoverns_admission_queue_depth{budget="search"}' in text
@@ -0,0 +1,83 @@
+import inspect
+import json
+import logging
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+
+def test_endpoints_are_wrapped_once():
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path.startswith("/v1"):
+            assert getattr(route.endpoint, "__profiled__", False), route.path
+            assert not getattr(route.endpoint.__wrapped__, "__profiled__", False), route.path
+
+
+def test_profiled_request_logs_endpoint_frames(client, monkeypatch, caplog):
+    monkeypatch.setenv("PROFILING_ENABLED", "1")
+    monkeypatch.setenv("PROFILE_SECRET", "s3cret")
+
+    with caplog.at_level(logging.INFO, logger="whogoverns.profile"):
+        response = client.get("/v1/events?iso3=FRA&year=1990", headers={"x-profile": "s3cret"})
+
+    assert response.status_code == 200
+    assert "handler;dur=" in response.headers["Server-Timing"]
+    assert "validate_serialize;dur=" in response.headers["Server-Timing"]
+
+    record = next(r for r in caplog.records if r.name == "whogoverns.profile")
+    profile = json.loads(record.getMessage().removeprefix("profile "))
+    assert "events.py" in profile["call_graph"]
+    assert "(events)" in profile["call_graph"]
+    assert len(profile["queries"]) == 1
+    assert profile["validate_serialize_ms"] is not None
+
+
+def test_request_without_secret_is_not_profiled(client, monkeypatch, caplog):
+    monkeypatch.setenv("PROFILING_ENABLED", "1")
+    monkeypatch.setenv("PROFILE_SECRET", "s3cret")
+
+    with caplog.at_level(logging.INFO, logger="whogoverns.profile"):
+        response = client.get("/v1/events?iso3=FRA&year=1990", headers={"x-profile": "wrong"})
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+    assert not [r for r in caplog.records if r.name == "whogoverns.profile"]
+
+
+def test_async_endpoint_stays_awaitable(monkeypatch):
+    from fastapi import APIRouter, FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.profiling import ProfiledRoute
+
+    router = APIRouter(route_class=ProfiledRoute)
+
+    @router.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    test_app = FastAPI()
+    test_app.include_router(router)
+    route = next(r for r in test_app.routes if getattr(r, "path", None) == "/ping")
+
+    assert inspect.iscoroutinefunction(route.endpoint)
+    assert TestClient(test_app).get("/ping").json() == {"pong": True}
+
+
+def test_async_endpoint_is_timed_when_profiled():
+    import asyncio
+
+    from app import profiling
+
+    async def ping():
+        return "pong"
+
+    wrapped = profiling._profiled(ping)
+    report, token = profiling.start()
+    try:
+        assert asyncio.run(wrapped()) == "pong"
+    finally:
+        profiling.stop(token)
+
+    assert report["endpoint_ms"] is not None
@@ -0,0 +1,138 @@
+import importlib
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app import query_budget
+from app.main import app
+
+# One representative request per /v1 route; a new route must be added here
+ROUTE_REQUESTS = {
+    "/v1/metadata": "/v1/metadata",
+    "/v1/map": "/v1/map?year=1990&group=OECD",
+    "/v1/timeline/{iso3}": "/v1/timeline/FRA?include_years=true",
+    "/v1/events": "/v1/events?iso3=FRA&year=1990",
+    "/v1/articles": "/v1/articles?iso3=FRA&year=1990",
+    "/v1/country/{iso3}": "/v1/country/FRA",
+    "/v1/country/{iso3}/summary": "/v1/country/FRA/summary?year=1990",
+    "/v1/country/{iso3}/bundle": "/v1/country/FRA/bundle?year=1990",
+    "/v1/search": "/v1/search?q=coup&iso3=FRA",
+}
+
+
+def _v1_routes():
+    return [r for r in app.routes if isinstance(r, APIRoute) and r.path.startswith("/v1")]
+
+
+@pytest.fixture(autouse=True)
+def enforce_budgets(monkeypatch):
+    monkeypatch.setattr(query_budget, "MODE", "enforce")
+
+
+def test_every_v1_route_declares_a_budget():
+    for route in _v1_routes():
+        assert query_budget.budget_of(route.endpoint) is not None, route.path
+
+
+def test_every_v1_route_has_a_budget_request():
+    assert {r.path for r in _v1_routes()} == set(ROUTE_REQUESTS)
+
+
+@pytest.mark.parametrize("path", sorted(ROUTE_REQUESTS))
+def test_route_stays_within_budget(client, path):
+    route = next(r for r in _v1_routes() if r.path == path)
+    budget = query_budget.budget_of(route.endpoint)
+
+    response = client.get(ROUTE_REQUESTS[path])
+
+    assert response.status_code == 200, response.text
+    assert int(response.headers["x-query-count"]) <= budget
+
+
+def test_route_over_budget_fails(client, monkeypatch):
+    route = next(r for r in _v1_routes() if r.path == "/v1/country/{iso3}/summary")
+    monkeypatch.setattr(route.endpoint, "__query_budget__", 1)
+
+    response = client.get(ROUTE_REQUESTS[route.path])
+
+    assert response.status_code == 500
+    body = response.json()
+    assert body["detail"] == "Query budget exceeded"
+    assert body["budget"] == 1
+    assert body["count"] > 1
+    assert "statements" not in body
+
+
+def test_over_budget_lists_statements_when_mode_is_explicit(client, monkeypatch):
+    monkeypatch.setattr(query_budget, "SHOW_STATEMENTS", True)
+    route = next(r for r in _v1_routes() if r.path == "/v1/country/{iso3}/summary")
+    monkeypatch.setattr(route.endpoint, "__query_budget__", 1)
+
+    body = client.get(ROUTE_REQUESTS[route.path]).json()
+
+    assert body["count"] == len(body["statements"]) > 1
+
+
+def test_route_over_budget_only_warns_in_warn_mode(client, monkeypatch):
+    monkeypatch.setattr(query_budget, "MODE", "warn")
+    route = next(r for r in _v1_routes() if r.path == "/v1/country/{iso3}/summary")
+    monkeypatch.setattr(route.endpoint, "__query_budget__", 1)
+
+    assert client.get(ROUTE_REQUESTS[route.path]).status_code == 200
+
+
+@pytest.mark.parametrize(
+    "env, explicit_mode, mode, show_statements",
+    [
+        (None, None, "off", False),
+        ("prod", None, "off", False),
+        ("dev", None, "enforce", False),
+        ("test", None, "enforce", False),
+        (None, "warn", "warn", True),
+    ],
+)
+def test_mode_defaults(monkeypatch, env, explicit_mode, mode, show_statements):
+    for name, value in (("ENV", env), ("QUERY_BUDGET_MODE", explicit_mode)):
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+        else:
+            monkeypatch.setenv(name, value)
+
+    try:
+        reloaded = importlib.reload(query_budget)
+        assert (reloaded.MODE, reloaded.SHOW_STATEMENTS) == (mode, show_statements)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(query_budget)
+
+
+def _q(sql, params=None):
+    return {"sql": sql, "params": params, "duration_ms": 0.0, "rows": 1}
+
+
+def test_analyze_flags_identical_statements_as_duplicates():
+    report = query_budget.analyze([
+        _q("select 1 from public.countries where iso3 = %(iso3)s", {"iso3": "FRA"}),
+        _q("select 1 from public.countries where iso3 = %(iso3)s", {"iso3": "FRA"}),
+        _q("select code from public.country_groups"),
+    ])
+
+    assert report["count"] == 3
+    assert report["duplicates"] == [{"sql": "select ? from public.countries where iso3 = %(iso3)s", "count": 2}]
+    assert report["repeated"] == []
+
+
+def test_analyze_flags_same_shape_with_different_params_as_repeated():
+    report = query_budget.analyze([
+        _q("select * from public.ruling_by_year where year = %(year)s", {"year": year})
+        for year in (1990, 1991, 1992)
+    ] + [
+        _q("select * from public.parties where id = 3"),
+        _q("select * from public.parties where id = 4"),
+    ])
+
+    assert report["duplicates"] == []
+    assert sorted(report["repeated"], key=lambda r: r["sql"]) == [
+        {"sql": "select * from public.parties where id = ?", "count": 2},
+        {"sql": "select * from public.ruling_by_year where year = %(year)s", "count": 3},
+    ]
@@ -0,0 +1,40 @@
+import random
+
+from app.segments import CountrySegments, build_all
+
+from tests.segments_reference import random_rows, reference_segments
+
+
+def test_segments_between_matches_reference():
+    rng = random.Random(1945)
+    for _ in range(3000):
+        rows = random_rows(rng)
+        segments = CountrySegments(rows)
+        for _ in range(20):
+            from_year = rng.randint(1935, 2035)
+            to_year = rng.randint(from_year, 2040)
+            in_range = [r for r in rows if from_year <= r["year"] <= to_year]
+            assert segments.segments_between(from_year, to_year) == reference_segments(in_range)
+
+
+def test_build_all_splits_by_country():
+    rng = random.Random(2025)
+    fra, usa = random_rows(rng, "FRA"), random_rows(rng, "USA")
+    countries = build_all(fra + usa)
+
+    for iso3, rows in (("FRA", fra), ("USA", usa)):
+        if rows:
+            assert countries[iso3].segments_between(1800, 2100) == reference_segments(rows)
+        else:
+            assert iso3 not in countries
+
+
+def test_at_and_by_year():
+    rows = random_rows(random.Random(7))
+    segments = CountrySegments(rows)
+    by_year = segments.by_year(1800, 2100)
+
+    assert sorted(by_year) == [r["year"] for r in rows]
+    for r in rows:
+        assert segments.at(r["year"]) is r
+    assert segments.at(1939) is None
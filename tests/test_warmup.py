@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+from app import warmup
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(warmup, "state", {"ready": False, "attempts": 0, "warmed": 0, "failed": 0, "timeline_failed": 0})
+    monkeypatch.setenv("WARMUP_RETRY_S", "0")
+    for name in ("WARMUP_COUNTRIES", "WARMUP_ACCESS_LOG", "WARMUP_MAX_FAILURES"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(warmup, "metadata", lambda **kw: None)
+    monkeypatch.setattr(warmup, "timeline", lambda **kw: None)
+
+
+def test_ready_after_successful_warmup(monkeypatch):
+    monkeypatch.setattr(warmup, "map_data", lambda **kw: None)
+
+    warmup.run()
+
+    assert warmup.state["ready"]
+    assert warmup.state["failed"] == 0
+    assert warmup.state["warmed"] == 2 * (len(warmup.YEARS) + 1)
+
+
+def test_failed_calls_are_retried_before_ready(monkeypatch):
+    calls = []
+
+    def flaky_map(**kw):
+        calls.append(kw["year"])
+        if len(calls) <= 5:
+            raise RuntimeError("db unreachable")
+
+    monkeypatch.setattr(warmup, "map_data", flaky_map)
+
+    warmup.run()
+
+    assert warmup.state["ready"]
+    assert warmup.state["attempts"] == 2
+    assert len(calls) == 2 * len(warmup.YEARS) + 5
+
+
+def test_not_ready_while_everything_fails(monkeypatch):
+    stop = threading.Event()
+
+    def down(**kw):
+        if warmup.state["attempts"] >= 3:
+            stop.set()
+        raise RuntimeError("db unreachable")
+
+    monkeypatch.setattr(warmup, "map_data", down)
+
+    warmup.run(stop)
+
+    assert not warmup.state["ready"]
+    assert warmup.state["failed"] == 2 * len(warmup.YEARS)
+
+
+def test_failures_under_threshold_are_ready(monkeypatch):
+    monkeypatch.setenv("WARMUP_MAX_FAILURES", "2")
+
+    def one_bad_year(**kw):
+        if kw["year"] == 1990:
+            raise RuntimeError("bad year")
+
+    monkeypatch.setattr(warmup, "map_data", one_bad_year)
+
+    warmup.run()
+
+    assert warmup.state["ready"]
+    assert warmup.state["failed"] == 2
+
+
+def test_bad_country_config_does_not_block_readiness(monkeypatch, tmp_path):
+    monkeypatch.setattr(warmup, "map_data", lambda **kw: None)
+    monkeypatch.setenv("WARMUP_ACCESS_LOG", str(tmp_path / "missing.log"))
+    monkeypatch.setenv("WARMUP_TOP_N", "not-a-number")
+
+    def unknown(**kw):
+        raise RuntimeError("Unknown country ISO3")
+
+    monkeypatch.setattr(warmup, "timeline", unknown)
+    monkeypatch.setenv("WARMUP_COUNTRIES", "XXX")
+
+    warmup.run()
+
+    assert warmup.state["ready"]
+    assert warmup.state["timeline_failed"] == 2
+
+
+def test_top_countries_reads_only_recent_log_lines(monkeypatch, tmp_path):
+    log = tmp_path / "access.log"
+    old = ["request_id=1 method=GET path=/v1/timeline/USA status=200"] * 100
+    recent = ["request_id=2 method=GET path=/v1/country/FRA status=200"] * 3
+    recent += ["request_id=3 method=GET path=/v1/timeline/DEU status=200"] * 2
+    log.write_text("\n".join(old + recent) + "\n")
+
+    monkeypatch.setenv("WARMUP_ACCESS_LOG", str(log))
+    monkeypatch.setenv("WARMUP_ACCESS_LOG_LINES", "5")
+
+    assert warmup.top_countries() == ["FRA", "DEU"]
+
+
+def test_tail_lines_across_blocks(tmp_path):
+    path = tmp_path / "big.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+    assert warmup._tail_lines(str(path), 3, block_size=16) == ["line 997", "line 998", "line 999"]
+
+
+def test_health_ready_reports_failures(client, monkeypatch):
+    monkeypatch.setattr(warmup, "state", {"ready": False, "attempts": 4, "warmed": 0, "failed": 162, "timeline_failed": 0})
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json() == {"status": "warming_up", "attempts": 4, "failed": 162}